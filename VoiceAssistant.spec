@@ -35,6 +35,9 @@ a = Analysis(
         # Core
         'customtkinter',
         'sounddevice',
+        'rtmixer',
+        'soundfile',
+        '_soundfile_data',
         'scipy',
         'scipy.io',
         'scipy.io.wavfile',
@@ -45,6 +48,7 @@ a = Analysis(
         'PIL',
         'PIL.Image',
         'PIL.ImageDraw',
+        'PIL.ImageTk',
         # AI / Whisper
         'faster_whisper',
         'ctranslate2',
@@ -57,6 +61,7 @@ a = Analysis(
         'anyio',
         'certifi',
         'h11',
+        'h2',
         'sniffio',
         'pydantic',
         'pydantic_core',
@@ -11,31 +11,105 @@ A single-file voice-to-text desktop application with:
 """
 
 import customtkinter as ctk
+from PIL import Image, ImageTk
 import sounddevice as sd
+import soundfile as sf
 import numpy as np
 import threading
 import json
+import functools
+import hashlib
 import os
 import sys
 import time
 import tempfile
 import re
 import math
-import glob
 import tkinter as tk
 from tkinter import filedialog
 from datetime import datetime, timedelta
 import ctypes
+from ctypes import wintypes
 import traceback
+import queue
+import atexit
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+import importlib.util
+
+# Optional dependencies. keyboard/pyperclip/rtmixer are light and used on every
+# dictation, so import them once here; the AI stacks are heavy, so only
+# check they exist and import them where they are first needed.
+try:
+    import keyboard
+except Exception:
+    keyboard = None
+try:
+    import pyperclip
+except Exception:
+    pyperclip = None
+try:
+    import rtmixer
+except Exception:
+    rtmixer = None
+_HAS_KEYBOARD = keyboard is not None
+_HAS_PYPERCLIP = pyperclip is not None
+_HAS_RTMIXER = rtmixer is not None
+_HAS_FASTER_WHISPER = importlib.util.find_spec("faster_whisper") is not None
+_HAS_OPENAI = importlib.util.find_spec("openai") is not None
+
 
 LOG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "debug.txt")
 
+_log_q = queue.SimpleQueue()
+_LOG_STOP = object()
+
+
+LOG_FSYNC_EVERY = 50
+
+
+def _log_worker():
+    """Drain queued log lines into LOG_FILE through a single raw fd."""
+    fd = None
+    with contextlib.suppress(Exception):
+        fd = os.open(LOG_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    pending = 0
+    while True:
+        item = _log_q.get()
+        if item is _LOG_STOP:
+            break
+        if fd is not None:
+            ts, msg = item
+            with contextlib.suppress(Exception):
+                # One write() syscall per line, bypassing Python's buffered IO
+                os.write(fd, f"{ts} - {msg}\n".encode("utf-8"))
+                pending += 1
+                if pending >= LOG_FSYNC_EVERY:
+                    os.fsync(fd)
+                    pending = 0
+    if fd is not None:
+        with contextlib.suppress(Exception):
+            os.fsync(fd)
+        with contextlib.suppress(Exception):
+            os.close(fd)
+
+
+_log_thread = threading.Thread(target=_log_worker, name="log-writer", daemon=True)
+_log_thread.start()
+
+
+def _log_shutdown():
+    with contextlib.suppress(Exception):
+        _log_q.put(_LOG_STOP)
+        _log_thread.join(timeout=1.0)
+
+
+atexit.register(_log_shutdown)
+
+
 def log(msg):
-    try:
-        with open(LOG_FILE, "a", encoding="utf-8") as f:
-            f.write(f"{datetime.now().isoformat()} - {msg}\n")
-    except Exception:
-        pass
+    # Never touch the disk on the caller's thread; the writer thread does it
+    _log_q.put((datetime.now().isoformat(), msg))
     print(msg)
 
 def handle_exception(exc_type, exc_value, exc_traceback):
@@ -74,15 +148,28 @@ DEFAULT_CONFIG = {
     "ai_prompt": "Ты — корректор текста. Тебе дают расшифровку голосовой записи. Твоя задача — ТОЛЬКО исправить грамматику, пунктуацию и опечатки. Верни ТОЛЬКО исправленный текст, ничего не добавляй, не отвечай на содержимое, не комментируй. Сохрани оригинальный смысл и стиль.",
     "autostart": False,
     "recording_retention_days": 0,
+    "audio_blocksize": 1024,
+    "audio_latency": "low",
 }
 
 
+_last_written_hash = None
+
+
+def _config_hash(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
 def load_config():
+    global _last_written_hash
     if os.path.exists(CONFIG_FILE):
         try:
-            with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-                saved = json.load(f)
+            with open(CONFIG_FILE, "rb") as f:
+                raw = f.read()
+            saved = json.loads(raw.decode("utf-8"))
             merged = {**DEFAULT_CONFIG, **saved}
+            # Remember what is on disk so saving an unchanged config is a no-op
+            _last_written_hash = _config_hash(raw)
             return merged
         except Exception:
             pass
@@ -90,8 +177,20 @@ def load_config():
 
 
 def save_config(cfg):
-    with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-        json.dump(cfg, f, indent=4, ensure_ascii=False)
+    """Write config atomically, skipping the write if nothing changed."""
+    global _last_written_hash
+    data = json.dumps(cfg, indent=4, ensure_ascii=False).encode("utf-8")
+    h = _config_hash(data)
+    if h == _last_written_hash:
+        return
+    # Write a temp file and rename over the original so a crash never leaves a partial config
+    tmp = CONFIG_FILE + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, CONFIG_FILE)
+    _last_written_hash = h
 
 
 CFG = load_config()
@@ -100,6 +199,7 @@ CFG = load_config()
 # AUTOSTART (Windows Registry)
 # ═══════════════════════════════════════════════════════════════
 
+@functools.lru_cache(maxsize=1)
 def _get_app_path():
     """Return the command to launch this app."""
     if getattr(sys, 'frozen', False):
@@ -115,8 +215,12 @@ def _get_app_path():
         return f'"{python}" "{script}" --autostart'
 
 
+_autostart_cached = None
+
+
 def set_autostart(enable: bool):
     """Add/remove this app from Windows autostart via registry."""
+    global _autostart_cached
     try:
         import winreg
         key_path = r"Software\Microsoft\Windows\CurrentVersion\Run"
@@ -133,9 +237,20 @@ def set_autostart(enable: bool):
         print(f"[Autostart] {'Enabled' if enable else 'Disabled'}")
     except Exception as e:
         print(f"[Autostart] Error: {e}")
+    finally:
+        # Re-read the registry on the next check instead of trusting our intent
+        _autostart_cached = None
+
 
 def is_autostart_enabled() -> bool:
-    """Check if app is in Windows autostart registry."""
+    """Check if app is in Windows autostart registry (cached until set_autostart)."""
+    global _autostart_cached
+    if _autostart_cached is None:
+        _autostart_cached = _query_autostart()
+    return _autostart_cached
+
+
+def _query_autostart() -> bool:
     try:
         import winreg
         key_path = r"Software\Microsoft\Windows\CurrentVersion\Run"
@@ -151,58 +266,253 @@ def is_autostart_enabled() -> bool:
         return False
 
 
+# ═══════════════════════════════════════════════════════════════
+# KEYBOARD INPUT (Windows SendInput)
+# ═══════════════════════════════════════════════════════════════
+
+INPUT_KEYBOARD = 1
+KEYEVENTF_KEYUP = 0x0002
+VK_CONTROL = 0x11
+VK_V = 0x56
+
+
+class KEYBDINPUT(ctypes.Structure):
+    _fields_ = [("wVk", wintypes.WORD), ("wScan", wintypes.WORD), ("dwFlags", wintypes.DWORD),
+                ("time", wintypes.DWORD), ("dwExtraInfo", ctypes.c_size_t)]
+
+
+class MOUSEINPUT(ctypes.Structure):
+    # Only needed so the INPUT union has the size Windows expects
+    _fields_ = [("dx", wintypes.LONG), ("dy", wintypes.LONG), ("mouseData", wintypes.DWORD),
+                ("dwFlags", wintypes.DWORD), ("time", wintypes.DWORD), ("dwExtraInfo", ctypes.c_size_t)]
+
+
+class _INPUTUNION(ctypes.Union):
+    _fields_ = [("ki", KEYBDINPUT), ("mi", MOUSEINPUT)]
+
+
+class INPUT(ctypes.Structure):
+    _anonymous_ = ("u",)
+    _fields_ = [("type", wintypes.DWORD), ("u", _INPUTUNION)]
+
+
 # ═══════════════════════════════════════════════════════════════
 # AUDIO RECORDER
 # ═══════════════════════════════════════════════════════════════
 
+def _ssq_i16_numpy(x):
+    """Sum of squares of an int16 vector (int64 avoids int32 overflow)."""
+    x = x.astype(np.int64)
+    return float(np.dot(x, x))
+
+
+try:
+    from numba import njit
+
+    @njit(cache=True, fastmath=True, nogil=True)
+    def _ssq_i16_jit(x):
+        # Single pass, no temporaries, and the GIL is released while it runs
+        s = 0.0
+        for v in x:
+            s += float(v) * float(v)
+        return s
+except ImportError:
+    _ssq_i16_jit = None
+
+# NumPy until the JIT kernel has compiled in the background, see _warmup_level_kernel
+_ssq_i16 = _ssq_i16_numpy
+
+
+def _mmcss_enter(task_name="Pro Audio"):
+    """Register the calling thread with MMCSS; returns a handle or None."""
+    try:
+        avrt = ctypes.WinDLL("avrt")
+        task = ctypes.c_ulong(0)
+        avrt.AvSetMmThreadCharacteristicsW.restype = ctypes.c_void_p
+        handle = avrt.AvSetMmThreadCharacteristicsW(task_name, ctypes.byref(task))
+        return handle or None
+    except Exception:
+        return None
+
+
+def _mmcss_leave(handle):
+    if not handle:
+        return
+    try:
+        avrt = ctypes.WinDLL("avrt")
+        avrt.AvRevertMmThreadCharacteristics.argtypes = [ctypes.c_void_p]
+        avrt.AvRevertMmThreadCharacteristics(handle)
+    except Exception:
+        pass
+
+
+# sd.query_devices() enumerates every host API, so share one result between lookups
+DEVICE_CACHE_TTL = 30
+_devices_cache = {"t": 0, "data": None}
+
+
 class AudioRecorder:
+    BLOCK_SIZE = 1024
+    RING_FRAMES = 2 ** 16  # ~4 s at 16 kHz; ring buffer size must be a power of two
+
     def __init__(self):
         self.sample_rate = 16000
         self.channels = 1
         self.is_recording = False
-        self.frames = []
+        # WAV is written while recording; _len counts frames written so far
+        self._sf = None
+        self._len = 0
+        # rtmixer always captures float32, so its ring and scratch hold float frames
+        self._scratch = np.empty((self.RING_FRAMES, self.channels), dtype=np.float32)
+        self._write_q = None
         self.stream = None
-        self.temp_file = os.path.join(tempfile.gettempdir(), "voice_assistant_temp.wav")
+        self.mixer = None
+        self._rb = None
+        self._rb_action = None
+        self._writer_thread = None
+        self._draining = False
+        self.temp_file = None  # Path of the current take; each take gets its own file
+        # Written by the audio/drain thread, read by the UI; a float attribute
+        # store is atomic under the GIL, so no lock is needed
         self._current_level = 0.0
-        self._level_lock = threading.Lock()
+        if _ssq_i16_jit is not None:
+            # Compiling can take seconds; don't hold up the first frame for it
+            threading.Thread(target=self._warmup_level_kernel, daemon=True).start()
+
+    @staticmethod
+    def _warmup_level_kernel():
+        """Compile the numba kernel, then switch the level computation over to it."""
+        global _ssq_i16
+        try:
+            _ssq_i16_jit(np.zeros(AudioRecorder.BLOCK_SIZE, dtype=np.int16))
+        except Exception as e:
+            print(f"[Recorder] Level kernel unavailable, using NumPy: {e}")
+            return
+        _ssq_i16 = _ssq_i16_jit
+
+    def _update_level(self, block):
+        """Update the level used by the waveform from an int16 block."""
+        # Calculate RMS level for waveform visualization
+        x = block.reshape(-1)
+        self._current_level = math.sqrt(_ssq_i16(x) / x.size) / 32768.0 if x.size else 0.0
+
+    def _update_level_float(self, block):
+        """Update the level from a float32 block in [-1, 1] (rtmixer path)."""
+        x = block.reshape(-1)
+        self._current_level = math.sqrt(float(np.dot(x, x)) / x.size) if x.size else 0.0
+
+    def _write_block(self, block):
+        # int16 blocks are already WAV-ready PCM; libsndfile converts float32 to PCM_16
+        self._sf.write(block)
+        self._len += block.shape[0]
 
     def _callback(self, indata, frames, time_info, status):
+        # Fallback path when rtmixer is missing or fails to start. File I/O is not safe
+        # on the PortAudio thread, so blocks are handed to the writer thread.
         if self.is_recording:
-            self.frames.append(indata.copy())
-            # Calculate RMS level for waveform visualization
-            rms = float(np.sqrt(np.mean(indata ** 2)))
-            with self._level_lock:
-                self._current_level = rms
+            self._write_q.put(indata.copy())
+            self._update_level(indata)
+
+    def _write_loop(self):
+        """Write blocks queued by the sounddevice callback to the WAV file."""
+        mmcss = _mmcss_enter()
+        try:
+            while True:
+                block = self._write_q.get()
+                if block is None:
+                    break
+                self._write_block(block)
+        finally:
+            _mmcss_leave(mmcss)
+
+    def _drain_loop(self):
+        """Pull blocks written by the rtmixer C callback out of the ring buffer."""
+        rb = self._rb
+        # Run the drainer at "Pro Audio" priority so it keeps up with the ring buffer under load
+        mmcss = _mmcss_enter()
+        try:
+            while True:
+                available = rb.read_available
+                if available:
+                    # Read into a reusable scratch block, then append it to the WAV
+                    n = rb.readinto(self._scratch[:available])
+                    block = self._scratch[:n]
+                    self._write_block(block)
+                    self._update_level_float(block)
+                elif not self._draining:
+                    break
+                else:
+                    time.sleep(0.01)
+        finally:
+            _mmcss_leave(mmcss)
 
     def get_current_level(self):
         """Return current audio RMS level (0.0 to ~1.0)."""
-        with self._level_lock:
-            return self._current_level
+        return self._current_level
 
-    def start(self, device=None):
+    def start(self, device=None, blocksize=None, latency="low"):
         if self.is_recording:
             return
+        blocksize = blocksize or self.BLOCK_SIZE
         self.is_recording = True
-        self.frames = []
+        self._len = 0
         self._current_level = 0.0
         try:
-            self.stream = sd.InputStream(
+            # A fresh file per take, so starting a new recording never truncates
+            # one that _transcribe has not read yet
+            fd, self.temp_file = tempfile.mkstemp(prefix="voice_assistant_", suffix=".wav")
+            os.close(fd)
+            self._sf = sf.SoundFile(self.temp_file, 'w', self.sample_rate, self.channels,
+                                    subtype='PCM_16')
+            if not (_HAS_RTMIXER and self._start_mixer(device, blocksize, latency)):
+                self._write_q = queue.SimpleQueue()
+                self._writer_thread = threading.Thread(target=self._write_loop, daemon=True)
+                self._writer_thread.start()
+                self.stream = sd.InputStream(
+                    samplerate=self.sample_rate,
+                    channels=self.channels,
+                    dtype='int16',
+                    blocksize=blocksize,
+                    latency=latency,
+                    callback=self._callback,
+                    device=device
+                )
+                self.stream.start()
+            print("[Recorder] Recording started.")
+        except Exception as e:
+            print(f"[Recorder] Error starting: {e}")
+            self.is_recording = False
+            self._close_stream()
+            self._close_mixer()
+            self._close_file()
+            self._discard_file()
+
+    def _start_mixer(self, device, blocksize, latency):
+        """Start capture through rtmixer; returns False so start() can fall back to sounddevice."""
+        try:
+            # PortAudio callback runs in C and only fills the ring buffer,
+            # so no Python code (and no GIL) is on the realtime thread.
+            # rtmixer fixes the sample format to float32, so no dtype here.
+            self.mixer = rtmixer.Recorder(
                 samplerate=self.sample_rate,
                 channels=self.channels,
-                callback=self._callback,
+                blocksize=blocksize,
+                latency=latency,
                 device=device
             )
-            self.stream.start()
-            print("[Recorder] Recording started.")
+            self._rb = rtmixer.RingBuffer(4 * self.channels, self.RING_FRAMES)
+            self.mixer.start()
+            self._rb_action = self.mixer.record_ringbuffer(self._rb)
         except Exception as e:
-            print(f"[Recorder] Error starting: {e}")
-            self.is_recording = False
+            print(f"[Recorder] rtmixer unavailable, using sounddevice: {e}")
+            self._close_mixer()
+            return False
+        self._draining = True
+        self._writer_thread = threading.Thread(target=self._drain_loop, daemon=True)
+        self._writer_thread.start()
+        return True
 
-    def stop(self):
-        if not self.is_recording:
-            return None
-        self.is_recording = False
-        self._current_level = 0.0
+    def _close_stream(self):
         if self.stream:
             try:
                 self.stream.stop()
@@ -210,43 +520,97 @@ class AudioRecorder:
             except Exception:
                 pass
             self.stream = None
+        if self._write_q is not None:
+            self._write_q.put(None)
+            if self._writer_thread is not None:
+                self._writer_thread.join(timeout=1.0)
+            self._write_q = None
+            self._writer_thread = None
+
+    def _close_mixer(self):
+        if self.mixer is None:
+            return
+        try:
+            if self._rb_action is not None:
+                self.mixer.cancel(self._rb_action)
+            self.mixer.stop()
+            self.mixer.close()
+        except Exception:
+            pass
+        self._draining = False
+        if self._writer_thread is not None:
+            self._writer_thread.join(timeout=1.0)
+        self.mixer = None
+        self._rb = None
+        self._rb_action = None
+        self._writer_thread = None
+
+    def _close_file(self):
+        if self._sf is not None:
+            try:
+                self._sf.close()
+            except Exception:
+                pass
+            self._sf = None
+
+    def _discard_file(self):
+        if self.temp_file:
+            try:
+                os.remove(self.temp_file)
+            except OSError:
+                pass
+            self.temp_file = None
+
+    def stop(self):
+        if not self.is_recording:
+            return None
+        self.is_recording = False
+        # Stop capture, then let the writer thread flush what is still queued
+        self._close_stream()
+        self._close_mixer()
+        self._close_file()
+        self._current_level = 0.0
 
-        if not self.frames:
+        if not self._len:
+            self._discard_file()
             return None
 
-        audio = np.concatenate(self.frames, axis=0)
-        audio_int16 = (audio * 32767).astype(np.int16).tobytes()
-        
-        import wave
-        with wave.open(self.temp_file, 'wb') as wf:
-            wf.setnchannels(self.channels)
-            wf.setsampwidth(2)  # 2 bytes for int16
-            wf.setframerate(self.sample_rate)
-            wf.writeframes(audio_int16)
-            
-        print(f"[Recorder] Saved to {self.temp_file}")
-        return self.temp_file
+        path, self.temp_file = self.temp_file, None
+        print(f"[Recorder] Saved to {path}")
+        return path
 
     @staticmethod
-    def get_devices():
-        """Return list of input device names."""
+    def _input_devices(max_age=DEVICE_CACHE_TTL):
+        """Return {name: index} of input devices, re-enumerating if older than max_age seconds."""
+        now = time.monotonic()
+        if _devices_cache["data"] is not None and now - _devices_cache["t"] < max_age:
+            return _devices_cache["data"]
         devices = sd.query_devices()
-        input_devs = ["По умолчанию"]
+        input_devs = {}
         for i, d in enumerate(devices):
             if d['max_input_channels'] > 0:
-                input_devs.append(f"{d['name']}")
+                # Keep the first index for duplicate names, as the old lookup did
+                input_devs.setdefault(d['name'], i)
+        _devices_cache["data"] = input_devs
+        _devices_cache["t"] = now
         return input_devs
 
+    @staticmethod
+    def get_devices(max_age=DEVICE_CACHE_TTL):
+        """Return list of input device names."""
+        return ["По умолчанию"] + list(AudioRecorder._input_devices(max_age))
+
     @staticmethod
     def get_device_index(name):
         """Return the sounddevice index for a given device name, or None for default."""
         if not name or name == "По умолчанию":
             return None
-        devices = sd.query_devices()
-        for i, d in enumerate(devices):
-            if d['name'] == name and d['max_input_channels'] > 0:
-                return i
-        return None
+        # Called on every recording start: trust the cached map regardless of age.
+        # The settings page refreshes it; only an unknown name forces a re-scan.
+        idx = AudioRecorder._input_devices(max_age=math.inf).get(name)
+        if idx is None:
+            idx = AudioRecorder._input_devices(max_age=0).get(name)
+        return idx
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -265,6 +629,11 @@ class WaveformOverlay:
     BG_COLOR = "#111111"
     BAR_COLOR_LOW = "#3a86ff"
     BAR_COLOR_HIGH = "#ff006e"
+    COLOR_LUT_SIZE = 32
+    # Bar-area geometry depends only on the constants above
+    _TOTAL_W = BAR_COUNT * BAR_WIDTH + (BAR_COUNT - 1) * BAR_GAP
+    _START_X = (WIDTH - _TOTAL_W) // 2
+    _MAX_BH = HEIGHT - 16
 
     def __init__(self, master, recorder: AudioRecorder, stop_callback=None):
         self.master = master
@@ -273,17 +642,27 @@ class WaveformOverlay:
         self.win = None
         self.canvas = None
         self.is_visible = False
-        self._bar_ids = []
-        self._levels_history = [0.0] * self.BAR_COUNT
-
-    def show(self):
-        if self.win is not None:
-            try:
-                self.win.destroy()
-            except Exception:
-                pass
-
+        self._bar_x = []
+        self._bg_polygon = None
+        self._img_id = None
+        self._photo = None
+        self._pixels = None
+        self._anim_after_id = None
+        # Ring buffer of recent levels; _hist_idx points at the oldest entry
+        self._levels_history = np.zeros(self.BAR_COUNT, np.float32)
+        self._hist_idx = 0
+        self._prev_heights = None
+        self._prev_colors = None
+        # Level -> RGB lookup table, so the hot loop has no branches or formatting
+        self._color_lut = np.array(
+            [self._hex_to_rgb(self._level_color(k / (self.COLOR_LUT_SIZE - 1)))
+             for k in range(self.COLOR_LUT_SIZE)], dtype=np.uint8)
+        self._bg_rgb = np.array(self._hex_to_rgb(self.BG_COLOR), dtype=np.uint8)
+
+    def _build(self):
+        """Create the overlay window once; later sessions only show/hide it."""
         self.win = tk.Toplevel(self.master)
+        self.win.withdraw()
         self.win.overrideredirect(True)
         self.win.attributes("-topmost", True)
         self.win.attributes("-alpha", 0.92)
@@ -303,13 +682,6 @@ class WaveformOverlay:
         except Exception:
             pass
 
-        # Position: bottom center of screen
-        sw = self.win.winfo_screenwidth()
-        sh = self.win.winfo_screenheight()
-        x = (sw - self.WIDTH) // 2
-        y = sh - self.HEIGHT - 60
-        self.win.geometry(f"{self.WIDTH}x{self.HEIGHT}+{x}+{y}")
-
         self.canvas = tk.Canvas(
             self.win, width=self.WIDTH, height=self.HEIGHT,
             bg="#000000", highlightthickness=0
@@ -317,41 +689,63 @@ class WaveformOverlay:
         self.canvas.pack()
 
         # Draw rounded rectangle background
-        self._draw_rounded_rect(0, 0, self.WIDTH, self.HEIGHT, self.CORNER_RADIUS, self.BG_COLOR)
-
-        # Create bar rectangles
-        self._bar_ids = []
-        total_bars_width = self.BAR_COUNT * self.BAR_WIDTH + (self.BAR_COUNT - 1) * self.BAR_GAP
-        start_x = (self.WIDTH - total_bars_width) / 2
-        max_bar_height = self.HEIGHT - 20
+        self._bg_polygon = self._draw_rounded_rect(
+            0, 0, self.WIDTH, self.HEIGHT, self.CORNER_RADIUS, self.BG_COLOR)
 
+        # Bars are rendered into one image that covers the bar area, so each
+        # frame is a single PhotoImage update instead of one Tcl call per bar
+        self._bar_x = []
         for i in range(self.BAR_COUNT):
-            bx = start_x + i * (self.BAR_WIDTH + self.BAR_GAP)
-            # Start with minimal height
-            bar_h = 3
-            by = (self.HEIGHT - bar_h) / 2
-            bar_id = self.canvas.create_rectangle(
-                bx, by, bx + self.BAR_WIDTH, by + bar_h,
-                fill=self.BAR_COLOR_LOW, outline="", width=0
-            )
-            self._bar_ids.append(bar_id)
+            bx = i * (self.BAR_WIDTH + self.BAR_GAP)
+            self._bar_x.append((bx, bx + self.BAR_WIDTH))
 
-        self._levels_history = [0.0] * self.BAR_COUNT
-        self.is_visible = True
+        self._pixels = np.empty((self._MAX_BH, self._TOTAL_W, 3), dtype=np.uint8)
+        self._pixels[:] = self._bg_rgb
+        self._photo = ImageTk.PhotoImage(Image.fromarray(self._pixels), master=self.win)
+        self._img_id = self.canvas.create_image(
+            self._START_X, (self.HEIGHT - self._MAX_BH) // 2, image=self._photo, anchor="nw")
 
         # Click anywhere on overlay to stop recording
         self.canvas.bind("<Button-1>", self._on_click)
 
+    def show(self):
+        if self.win is None:
+            self._build()
+
+        # Position: bottom center of screen
+        sw = self.win.winfo_screenwidth()
+        sh = self.win.winfo_screenheight()
+        x = (sw - self.WIDTH) // 2
+        y = sh - self.HEIGHT - 60
+        self.win.geometry(f"{self.WIDTH}x{self.HEIGHT}+{x}+{y}")
+
+        self._levels_history[:] = 0.0
+        self._hist_idx = 0
+        self._prev_heights = None
+        self._prev_colors = None
+
+        if self._anim_after_id is not None:
+            self.win.after_cancel(self._anim_after_id)
+            self._anim_after_id = None
+
+        self.win.deiconify()
+        self.win.attributes("-topmost", True)
+        self.is_visible = True
         self._animate()
 
     def hide(self):
         self.is_visible = False
         if self.win:
+            if self._anim_after_id is not None:
+                try:
+                    self.win.after_cancel(self._anim_after_id)
+                except Exception:
+                    pass
+                self._anim_after_id = None
             try:
-                self.win.destroy()
+                self.win.withdraw()
             except Exception:
                 pass
-            self.win = None
 
     def _draw_rounded_rect(self, x1, y1, x2, y2, r, color):
         """Draw a rounded rectangle on the canvas."""
@@ -369,7 +763,25 @@ class WaveformOverlay:
             x1, y1 + r,
             x1, y1,
         ]
-        self.canvas.create_polygon(points, fill=color, outline=color, smooth=True)
+        return self.canvas.create_polygon(points, fill=color, outline=color, smooth=True)
+
+    @staticmethod
+    def _hex_to_rgb(color):
+        return tuple(int(color[i:i + 2], 16) for i in (1, 3, 5))
+
+    def _level_color(self, lvl):
+        """Return the bar color for a normalized level (0.0 to 1.0)."""
+        if lvl > 0.7:
+            return self.BAR_COLOR_HIGH
+        elif lvl > 0.35:
+            # Blend between blue and pink
+            t = (lvl - 0.35) / 0.35
+            r = int(58 + t * (255 - 58))
+            g = int(134 - t * 134)
+            b = int(255 - t * (255 - 110))
+            return f"#{r:02x}{g:02x}{b:02x}"
+        else:
+            return self.BAR_COLOR_LOW
 
     def _animate(self):
         if not self.is_visible or not self.win:
@@ -380,40 +792,34 @@ class WaveformOverlay:
             # Normalize level (typical mic RMS is 0-0.1, amplify for visibility)
             normalized = min(level * 15.0, 1.0)
 
-            # Shift history left and add new level
-            self._levels_history.pop(0)
-            self._levels_history.append(normalized)
-
-            total_bars_width = self.BAR_COUNT * self.BAR_WIDTH + (self.BAR_COUNT - 1) * self.BAR_GAP
-            start_x = (self.WIDTH - total_bars_width) / 2
-            max_bar_height = self.HEIGHT - 16
-
-            for i, lvl in enumerate(self._levels_history):
-                bx = start_x + i * (self.BAR_WIDTH + self.BAR_GAP)
-                bar_h = max(3, lvl * max_bar_height)
-                by = (self.HEIGHT - bar_h) / 2
-
-                self.canvas.coords(
-                    self._bar_ids[i],
-                    bx, by, bx + self.BAR_WIDTH, by + bar_h
-                )
-
-                # Color gradient based on level
-                if lvl > 0.7:
-                    color = self.BAR_COLOR_HIGH
-                elif lvl > 0.35:
-                    # Blend between blue and pink
-                    t = (lvl - 0.35) / 0.35
-                    r = int(58 + t * (255 - 58))
-                    g = int(134 - t * 134)
-                    b = int(255 - t * (255 - 110))
-                    color = f"#{r:02x}{g:02x}{b:02x}"
-                else:
-                    color = self.BAR_COLOR_LOW
-
-                self.canvas.itemconfig(self._bar_ids[i], fill=color)
-
-            self.win.after(50, self._animate)
+            # Overwrite the oldest level instead of shifting the whole history
+            hist = self._levels_history
+            hist[self._hist_idx] = normalized
+            self._hist_idx = (self._hist_idx + 1) % self.BAR_COUNT
+
+            # Levels in display order, oldest bar on the left
+            levels = np.roll(hist, -self._hist_idx)
+            max_bar_height = self._MAX_BH
+            heights = np.maximum(3, np.rint(levels * max_bar_height)).astype(np.int32)
+            colors = (levels * (self.COLOR_LUT_SIZE - 1)).astype(np.int32)
+
+            # Skip the redraw entirely when no bar changed
+            if (self._prev_heights is None
+                    or not np.array_equal(heights, self._prev_heights)
+                    or not np.array_equal(colors, self._prev_colors)):
+                px = self._pixels
+                px[:] = self._bg_rgb
+                lut = self._color_lut
+                for i in range(self.BAR_COUNT):
+                    bar_h = int(heights[i])
+                    by_top = (max_bar_height - bar_h) // 2
+                    bx_l, bx_r = self._bar_x[i]
+                    px[by_top:by_top + bar_h, bx_l:bx_r] = lut[colors[i]]
+                self._photo.paste(Image.fromarray(px))
+                self._prev_heights = heights
+                self._prev_colors = colors
+
+            self._anim_after_id = self.win.after(50, self._animate)
         except Exception:
             pass
 
@@ -611,7 +1017,13 @@ ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("blue")
 
 
+CLEANUP_INTERVAL_S = 300
+
+
 class VoiceAssistantApp(ctk.CTk):
+    # Shared CTkFont objects keyed by (size, weight); see _font()
+    _FONT_CACHE: dict = {}
+
     def __init__(self, start_hidden=False):
         super().__init__()
         self._start_hidden = start_hidden
@@ -621,13 +1033,28 @@ class VoiceAssistantApp(ctk.CTk):
         self.minsize(700, 500)
 
         self.recorder = AudioRecorder()
+        self._init_win32()
         self.overlay = WaveformOverlay(self, self.recorder, stop_callback=self._stop_recording)
         self.floating_btn = FloatingButton(self, self._toggle_recording)
         self.transcriber = None  # Lazy-loaded
         self._model_loading = False
+        self._model_lock = threading.Lock()  # Only one thread may construct the model
+        self._compiled_reps = None  # Compiled replacement patterns, reset on edit
+        # Single worker for housekeeping disk I/O so UI/transcription never wait on it
+        self._io_exec = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vaio")
+        atexit.register(self._io_exec.shutdown, wait=False)
+        self._last_cleanup = 0.0  # time.monotonic() of the last retention sweep
         self._openai_client = None  # Cached OpenAI client
+        self._openai_key = None  # API key the cached client was built with
+        self._openai_lock = threading.Lock()
         self._is_recording = False
         self._current_hotkey_id = None
+        self._save_pending = False
+        self._save_after_id = None
+        self._rebuild_after_id = None
+        self._slider_text = {}  # Last text shown per slider label, see _show_slider_value
+        self._slider_time = {}
+        self._vars = {}  # key -> (tk variable, cast), see _bind_setting
 
         # ── System tray ──
         self.tray = TrayManager(self)
@@ -647,7 +1074,7 @@ class VoiceAssistantApp(ctk.CTk):
         self.sidebar.grid_rowconfigure(8, weight=1)
 
         ctk.CTkLabel(self.sidebar, text="🎙 Voice Assistant",
-                     font=ctk.CTkFont(size=18, weight="bold")).grid(row=0, column=0, padx=20, pady=(25, 20))
+                     font=self._font(18, "bold")).grid(row=0, column=0, padx=20, pady=(25, 20))
 
         self.nav_buttons = {}
         pages = [
@@ -672,16 +1099,21 @@ class VoiceAssistantApp(ctk.CTk):
 
 
         # ── Content area ──
+        # Pages are built on first visit; only the main page is needed at startup
         self.pages = {}
-        self._build_main_page()
-        self._build_audio_page()
-        self._build_overlay_page()
-        self._build_replacements_page()
-        self._build_ai_page()
+        self._current_page = None
+        self._page_builders = {
+            "main": self._build_main_page,
+            "audio": self._build_audio_page,
+            "overlay": self._build_overlay_page,
+            "replacements": self._build_replacements_page,
+            "ai": self._build_ai_page,
+        }
 
         self.show_page("main")
 
         # ── Register hotkeys after UI is up ──
+        self.bind("<<ToggleRecord>>", lambda e: self._toggle_recording())
         self.after(500, self._register_hotkeys)
 
         # ── Show floating button if enabled ──
@@ -689,15 +1121,70 @@ class VoiceAssistantApp(ctk.CTk):
             self.after(600, self.floating_btn.show)
 
         # ── Cleanup old recordings ──
-        self.after(800, self._cleanup_old_recordings)
+        self.after(800, self._periodic_cleanup)
 
-        # ── Start lazy AI model loading ──
-        self.after(1000, self._lazy_load_model)
+        # ── Pre-warm Whisper and the OpenAI client so the first dictation finds them ready ──
+        self._lazy_load_model()
+        threading.Thread(target=self._prewarm_openai, daemon=True).start()
 
         # ── If launched via autostart, hide to tray immediately ──
         if self._start_hidden:
             self.after(100, self._hide_to_tray)
 
+    def _font(self, size=12, weight="normal"):
+        """Return a shared CTkFont so widgets don't each create their own Tk font."""
+        k = (size, weight)
+        f = self._FONT_CACHE.get(k)
+        if f is None:
+            f = ctk.CTkFont(size=size, weight=weight)
+            self._FONT_CACHE[k] = f
+        return f
+
+    def _init_win32(self):
+        """Load user32/kernel32 once and prototype the functions used for focus/paste."""
+        self._user32 = None
+        self._kernel32 = None
+        try:
+            user32 = ctypes.WinDLL("user32", use_last_error=True)
+            kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        except (AttributeError, OSError) as e:
+            print(f"[Win32] Not available: {e}")
+            return
+        user32.GetForegroundWindow.argtypes = []
+        user32.GetForegroundWindow.restype = wintypes.HWND
+        user32.SetForegroundWindow.argtypes = [wintypes.HWND]
+        user32.SetForegroundWindow.restype = wintypes.BOOL
+        user32.AttachThreadInput.argtypes = [wintypes.DWORD, wintypes.DWORD, wintypes.BOOL]
+        user32.AttachThreadInput.restype = wintypes.BOOL
+        user32.GetWindowThreadProcessId.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.DWORD)]
+        user32.GetWindowThreadProcessId.restype = wintypes.DWORD
+        user32.SendInput.argtypes = [wintypes.UINT, ctypes.POINTER(INPUT), ctypes.c_int]
+        user32.SendInput.restype = wintypes.UINT
+        kernel32.GetCurrentThreadId.argtypes = []
+        kernel32.GetCurrentThreadId.restype = wintypes.DWORD
+        self._user32 = user32
+        self._kernel32 = kernel32
+
+    def _send_ctrl_v(self):
+        """Inject Ctrl+V as one SendInput batch; returns False if it could not be sent."""
+        if self._user32 is None:
+            return False
+        events = (
+            (VK_CONTROL, 0),
+            (VK_V, 0),
+            (VK_V, KEYEVENTF_KEYUP),
+            (VK_CONTROL, KEYEVENTF_KEYUP),
+        )
+        arr = (INPUT * len(events))()
+        for item, (vk, flags) in zip(arr, events):
+            item.type = INPUT_KEYBOARD
+            item.ki = KEYBDINPUT(wVk=vk, wScan=0, dwFlags=flags, time=0, dwExtraInfo=0)
+        sent = self._user32.SendInput(len(events), arr, ctypes.sizeof(INPUT))
+        if sent != len(events):
+            log(f"[Paste] SendInput sent {sent}/{len(events)} events (error {ctypes.get_last_error()})")
+            return False
+        return True
+
     # ─────────────────────────────────────────────────────────
     # Window management (tray)
     # ─────────────────────────────────────────────────────────
@@ -721,12 +1208,15 @@ class VoiceAssistantApp(ctk.CTk):
 
     def _quit_app(self):
         """Fully quit the application."""
+        if self._save_after_id is not None:
+            self.after_cancel(self._save_after_id)
+        self._flush_save()
         self.tray.destroy()
-        try:
-            import keyboard
-            keyboard.unhook_all()
-        except Exception:
-            pass
+        if _HAS_KEYBOARD:
+            try:
+                keyboard.unhook_all()
+            except Exception:
+                pass
         self.destroy()
 
     # ─────────────────────────────────────────────────────────
@@ -736,17 +1226,17 @@ class VoiceAssistantApp(ctk.CTk):
         page = ctk.CTkScrollableFrame(self, corner_radius=0, fg_color="transparent")
 
         ctk.CTkLabel(page, text="Горячие клавиши и Язык",
-                     font=ctk.CTkFont(size=20, weight="bold")).pack(anchor="w", pady=(20, 15), padx=25)
+                     font=self._font(20, "bold")).pack(anchor="w", pady=(20, 15), padx=25)
 
         # --- Hotkey Section ---
         hk_frame = ctk.CTkFrame(page)
         hk_frame.pack(fill="x", padx=25, pady=8)
 
         ctk.CTkLabel(hk_frame, text="Горячая клавиша записи:",
-                     font=ctk.CTkFont(size=13)).grid(row=0, column=0, padx=15, pady=12)
+                     font=self._font(13)).grid(row=0, column=0, padx=15, pady=12)
 
         self.hk_display = ctk.CTkLabel(hk_frame, text=CFG["hotkey"],
-                                        font=ctk.CTkFont(size=14, weight="bold"),
+                                        font=self._font(14, "bold"),
                                         fg_color=("gray85", "gray25"),
                                         corner_radius=6, width=200)
         self.hk_display.grid(row=0, column=1, padx=10, pady=12)
@@ -760,28 +1250,27 @@ class VoiceAssistantApp(ctk.CTk):
         lang_frame.pack(fill="x", padx=25, pady=8)
 
         ctk.CTkLabel(lang_frame, text="Язык распознавания:",
-                     font=ctk.CTkFont(size=13)).grid(row=0, column=0, padx=15, pady=12)
+                     font=self._font(13)).grid(row=0, column=0, padx=15, pady=12)
 
         self.lang_menu = ctk.CTkOptionMenu(
             lang_frame,
             values=["auto", "ru", "en", "de", "fr", "es", "uk", "lv"],
-            command=self._on_language_change,
+            variable=self._bind_setting("language", ctk.StringVar(value=CFG["language"])),
             width=160
         )
-        self.lang_menu.set(CFG["language"])
         self.lang_menu.grid(row=0, column=1, padx=10, pady=12)
 
         # --- Checkboxes ---
-        self.autopaste_var = ctk.BooleanVar(value=CFG.get("auto_paste", True))
+        self.autopaste_var = self._bind_setting(
+            "auto_paste", ctk.BooleanVar(value=CFG.get("auto_paste", True)))
         ctk.CTkCheckBox(page, text="Вставлять текст в приложение, где была нажата клавиша",
-                        variable=self.autopaste_var,
-                        command=lambda: self._save("auto_paste", self.autopaste_var.get())
+                        variable=self.autopaste_var
                         ).pack(anchor="w", padx=25, pady=8)
 
-        self.automic_var = ctk.BooleanVar(value=CFG.get("auto_enable_mic", True))
+        self.automic_var = self._bind_setting(
+            "auto_enable_mic", ctk.BooleanVar(value=CFG.get("auto_enable_mic", True)))
         ctk.CTkCheckBox(page, text="Автоматически включить микрофон",
-                        variable=self.automic_var,
-                        command=lambda: self._save("auto_enable_mic", self.automic_var.get())
+                        variable=self.automic_var
                         ).pack(anchor="w", padx=25, pady=8)
 
         # --- Autostart with Windows ---
@@ -805,16 +1294,16 @@ class VoiceAssistantApp(ctk.CTk):
         page = ctk.CTkScrollableFrame(self, corner_radius=0, fg_color="transparent")
 
         ctk.CTkLabel(page, text="Настройки записи",
-                     font=ctk.CTkFont(size=20, weight="bold")).pack(anchor="w", pady=(20, 15), padx=25)
+                     font=self._font(20, "bold")).pack(anchor="w", pady=(20, 15), padx=25)
 
         # --- Microphone Selection ---
         mic_frame = ctk.CTkFrame(page)
         mic_frame.pack(fill="x", padx=25, pady=8)
 
         ctk.CTkLabel(mic_frame, text="Микрофон:",
-                     font=ctk.CTkFont(size=13)).grid(row=0, column=0, padx=15, pady=12)
+                     font=self._font(13)).grid(row=0, column=0, padx=15, pady=12)
 
-        devices = AudioRecorder.get_devices()
+        devices = self._get_devices()
         self.mic_menu = ctk.CTkOptionMenu(mic_frame, values=devices, width=280,
                                            command=lambda v: self._save("microphone", v))
         current_mic = CFG.get("microphone", "По умолчанию")
@@ -830,7 +1319,7 @@ class VoiceAssistantApp(ctk.CTk):
         path_frame.pack(fill="x", padx=25, pady=8)
 
         ctk.CTkLabel(path_frame, text="Папка для записей:",
-                     font=ctk.CTkFont(size=13)).grid(row=0, column=0, padx=15, pady=12)
+                     font=self._font(13)).grid(row=0, column=0, padx=15, pady=12)
 
         self.path_var = ctk.StringVar(value=CFG.get("save_recordings_path", ""))
         path_entry = ctk.CTkEntry(path_frame, textvariable=self.path_var, width=320)
@@ -841,7 +1330,7 @@ class VoiceAssistantApp(ctk.CTk):
 
         # --- Timing settings ---
         ctk.CTkLabel(page, text="Параметры таймингов",
-                     font=ctk.CTkFont(size=16, weight="bold")).pack(anchor="w", pady=(20, 10), padx=25)
+                     font=self._font(16, "bold")).pack(anchor="w", pady=(20, 10), padx=25)
 
         timing_frame = ctk.CTkFrame(page)
         timing_frame.pack(fill="x", padx=25, pady=8)
@@ -855,7 +1344,7 @@ class VoiceAssistantApp(ctk.CTk):
 
         self.timing_vars = {}
         for label, key, row in timings:
-            ctk.CTkLabel(timing_frame, text=label, font=ctk.CTkFont(size=12)).grid(
+            ctk.CTkLabel(timing_frame, text=label, font=self._font(12)).grid(
                 row=row, column=0, padx=15, pady=8, sticky="w")
             var = ctk.StringVar(value=str(CFG.get(key, 0)))
             self.timing_vars[key] = var
@@ -867,13 +1356,13 @@ class VoiceAssistantApp(ctk.CTk):
 
         # --- Recording retention ---
         ctk.CTkLabel(page, text="Хранение записей",
-                     font=ctk.CTkFont(size=16, weight="bold")).pack(anchor="w", pady=(20, 10), padx=25)
+                     font=self._font(16, "bold")).pack(anchor="w", pady=(20, 10), padx=25)
 
         ret_frame = ctk.CTkFrame(page)
         ret_frame.pack(fill="x", padx=25, pady=8)
 
         ctk.CTkLabel(ret_frame, text="Удалять записи старше:",
-                     font=ctk.CTkFont(size=13)).grid(row=0, column=0, padx=15, pady=12)
+                     font=self._font(13)).grid(row=0, column=0, padx=15, pady=12)
 
         retention_options = ["Не удалять", "1 день", "3 дня", "7 дней", "30 дней"]
         retention_map = {0: "Не удалять", 1: "1 день", 3: "3 дня", 7: "7 дней", 30: "30 дней"}
@@ -887,11 +1376,40 @@ class VoiceAssistantApp(ctk.CTk):
         self.retention_menu.set(current_label)
         self.retention_menu.grid(row=0, column=1, padx=10, pady=12)
 
+        # --- Audio stream ---
+        ctk.CTkLabel(page, text="Параметры аудиопотока",
+                     font=self._font(16, "bold")).pack(anchor="w", pady=(20, 10), padx=25)
+
+        stream_frame = ctk.CTkFrame(page)
+        stream_frame.pack(fill="x", padx=25, pady=8)
+
+        ctk.CTkLabel(stream_frame, text="Размер блока (сэмплы):",
+                     font=self._font(13)).grid(row=0, column=0, padx=15, pady=12, sticky="w")
+        self.blocksize_menu = ctk.CTkOptionMenu(
+            stream_frame, values=["256", "512", "1024", "2048", "4096"], width=180,
+            variable=self._bind_setting(
+                "audio_blocksize", ctk.StringVar(value=str(CFG.get("audio_blocksize", 1024))), int)
+        )
+        self.blocksize_menu.grid(row=0, column=1, padx=10, pady=12)
+
+        ctk.CTkLabel(stream_frame, text="Задержка:",
+                     font=self._font(13)).grid(row=1, column=0, padx=15, pady=12, sticky="w")
+        self.latency_menu = ctk.CTkOptionMenu(
+            stream_frame, values=["low", "high"], width=180,
+            variable=self._bind_setting(
+                "audio_latency", ctk.StringVar(value=CFG.get("audio_latency", "low")))
+        )
+        self.latency_menu.grid(row=1, column=1, padx=10, pady=12)
+
         self.pages["audio"] = page
 
+    def _get_devices(self, max_age=DEVICE_CACHE_TTL):
+        """Input device names; devices rarely change, so reuse the enumeration for max_age seconds."""
+        return AudioRecorder.get_devices(max_age)
+
     def _refresh_mic_list(self):
         """Refresh the microphone dropdown with current devices."""
-        devices = AudioRecorder.get_devices()
+        devices = self._get_devices(max_age=0)
         self.mic_menu.configure(values=devices)
         current = CFG.get("microphone", "По умолчанию")
         if current in devices:
@@ -908,7 +1426,7 @@ class VoiceAssistantApp(ctk.CTk):
         page = ctk.CTkScrollableFrame(self, corner_radius=0, fg_color="transparent")
 
         ctk.CTkLabel(page, text="Плавающая кнопка",
-                     font=ctk.CTkFont(size=20, weight="bold")).pack(anchor="w", pady=(20, 15), padx=25)
+                     font=self._font(20, "bold")).pack(anchor="w", pady=(20, 15), padx=25)
 
         # Show / hide floating button
         self.show_float_var = ctk.BooleanVar(value=CFG.get("show_floating_button", True))
@@ -927,6 +1445,7 @@ class VoiceAssistantApp(ctk.CTk):
                                           command=self._on_size_change)
         self.size_slider.set(CFG.get("floating_btn_size", 60))
         self.size_slider.pack(fill="x", padx=15, pady=(0, 10))
+        self.size_slider.bind("<ButtonRelease-1>", self._on_size_release)
 
         # Opacity slider
         opac_frame = ctk.CTkFrame(page)
@@ -939,11 +1458,12 @@ class VoiceAssistantApp(ctk.CTk):
                                           command=self._on_opacity_change)
         self.opac_slider.set(int(CFG.get("floating_btn_opacity", 0.85) * 100))
         self.opac_slider.pack(fill="x", padx=15, pady=(0, 10))
+        self.opac_slider.bind("<ButtonRelease-1>", self._on_opacity_release)
 
         # Position dropdown
         pos_frame = ctk.CTkFrame(page)
         pos_frame.pack(fill="x", padx=25, pady=8)
-        ctk.CTkLabel(pos_frame, text="Позиция:", font=ctk.CTkFont(size=13)).grid(row=0, column=0, padx=15, pady=12)
+        ctk.CTkLabel(pos_frame, text="Позиция:", font=self._font(13)).grid(row=0, column=0, padx=15, pady=12)
         positions = ["Правый нижний", "Правый верхний", "Левый нижний", "Левый верхний"]
         self.pos_menu = ctk.CTkOptionMenu(pos_frame, values=positions, width=180,
                                            command=self._on_position_change)
@@ -951,7 +1471,7 @@ class VoiceAssistantApp(ctk.CTk):
         self.pos_menu.grid(row=0, column=1, padx=10, pady=12)
 
         ctk.CTkLabel(page, text="💡 Правая кнопка мыши — перетащить кнопку",
-                     text_color="gray50", font=ctk.CTkFont(size=11)).pack(anchor="w", padx=25, pady=(10, 5))
+                     text_color="gray50", font=self._font(11)).pack(anchor="w", padx=25, pady=(10, 5))
 
         self.pages["overlay"] = page
 
@@ -962,7 +1482,7 @@ class VoiceAssistantApp(ctk.CTk):
         page = ctk.CTkScrollableFrame(self, corner_radius=0, fg_color="transparent")
 
         ctk.CTkLabel(page, text="Автозамены текста",
-                     font=ctk.CTkFont(size=20, weight="bold")).pack(anchor="w", pady=(20, 15), padx=25)
+                     font=self._font(20, "bold")).pack(anchor="w", pady=(20, 15), padx=25)
 
         ctk.CTkLabel(page, text="Слова или фразы, которые будут автоматически заменяться\n"
                                 "после распознавания речи.",
@@ -987,6 +1507,8 @@ class VoiceAssistantApp(ctk.CTk):
         # List of existing replacements
         self.rep_list_frame = ctk.CTkFrame(page)
         self.rep_list_frame.pack(fill="x", padx=25, pady=10)
+        self._rep_rows = []  # Reused {frame, label, button} widgets, one per replacement
+        self._rep_empty_label = None
         self._refresh_replacements_list()
 
         self.pages["replacements"] = page
@@ -998,38 +1520,38 @@ class VoiceAssistantApp(ctk.CTk):
         page = ctk.CTkScrollableFrame(self, corner_radius=0, fg_color="transparent")
 
         ctk.CTkLabel(page, text="Настройки ИИ",
-                     font=ctk.CTkFont(size=20, weight="bold")).pack(anchor="w", pady=(20, 15), padx=25)
+                     font=self._font(20, "bold")).pack(anchor="w", pady=(20, 15), padx=25)
 
         ctk.CTkLabel(page, text="Опциональный GPT для улучшения текста после распознавания.",
                      text_color="gray50").pack(anchor="w", padx=25, pady=(0, 10))
 
         # Enable/disable AI toggle
-        self.ai_enabled_var = ctk.BooleanVar(value=CFG.get("ai_enabled", True))
+        self.ai_enabled_var = self._bind_setting(
+            "ai_enabled", ctk.BooleanVar(value=CFG.get("ai_enabled", True)))
         ctk.CTkCheckBox(page, text="Включить обработку текста через ИИ",
                         variable=self.ai_enabled_var,
-                        command=lambda: self._save("ai_enabled", self.ai_enabled_var.get()),
-                        font=ctk.CTkFont(size=14, weight="bold")
+                        font=self._font(14, "bold")
                         ).pack(anchor="w", padx=25, pady=(5, 12))
 
         ai_frame = ctk.CTkFrame(page)
         ai_frame.pack(fill="x", padx=25, pady=8)
 
-        ctk.CTkLabel(ai_frame, text="API Ключ:", font=ctk.CTkFont(size=13)).grid(
+        ctk.CTkLabel(ai_frame, text="API Ключ:", font=self._font(13)).grid(
             row=0, column=0, padx=15, pady=12, sticky="w")
         self.api_key_var = ctk.StringVar(value=CFG.get("ai_api_key", ""))
         ctk.CTkEntry(ai_frame, textvariable=self.api_key_var, width=350,
                      placeholder_text="sk-...", show="•").grid(row=0, column=1, padx=10, pady=12)
 
-        ctk.CTkLabel(ai_frame, text="Модель:", font=ctk.CTkFont(size=13)).grid(
+        ctk.CTkLabel(ai_frame, text="Модель:", font=self._font(13)).grid(
             row=1, column=0, padx=15, pady=12, sticky="w")
         self.ai_model_menu = ctk.CTkOptionMenu(
             ai_frame, values=["gpt-4o-mini", "gpt-4o", "gpt-3.5-turbo"], width=200,
-            command=lambda v: self._save("ai_model", v)
+            variable=self._bind_setting(
+                "ai_model", ctk.StringVar(value=CFG.get("ai_model", "gpt-4o-mini")))
         )
-        self.ai_model_menu.set(CFG.get("ai_model", "gpt-4o-mini"))
         self.ai_model_menu.grid(row=1, column=1, padx=10, pady=12, sticky="w")
 
-        ctk.CTkLabel(ai_frame, text="Системный промпт:", font=ctk.CTkFont(size=13)).grid(
+        ctk.CTkLabel(ai_frame, text="Системный промпт:", font=self._font(13)).grid(
             row=2, column=0, padx=15, pady=12, sticky="nw")
         self.ai_prompt_var = ctk.StringVar(value=CFG.get("ai_prompt", ""))
         prompt_entry = ctk.CTkEntry(ai_frame, textvariable=self.ai_prompt_var, width=350)
@@ -1045,14 +1567,16 @@ class VoiceAssistantApp(ctk.CTk):
     # ═══════════════════════════════════════════════════════════
 
     def show_page(self, name):
-        for key, frame in self.pages.items():
-            frame.grid_forget()
-        for key, btn in self.nav_buttons.items():
-            if key == name:
-                btn.configure(fg_color=("gray75", "gray25"))
-            else:
-                btn.configure(fg_color="transparent")
+        if name == self._current_page:
+            return
+        if name not in self.pages:
+            self._page_builders[name]()
+        if self._current_page is not None:
+            self.pages[self._current_page].grid_forget()
+            self.nav_buttons[self._current_page].configure(fg_color="transparent")
+        self.nav_buttons[name].configure(fg_color=("gray75", "gray25"))
         self.pages[name].grid(row=0, column=1, sticky="nsew")
+        self._current_page = name
 
     # ═══════════════════════════════════════════════════════════
     # Callbacks & Helpers
@@ -1060,23 +1584,80 @@ class VoiceAssistantApp(ctk.CTk):
 
     def _save(self, key, value):
         CFG[key] = value
-        save_config(CFG)
         print(f"[Config] {key} = {value}")
+        # Coalesce bursts of changes into a single disk write
+        self._save_pending = True
+        if self._save_after_id is not None:
+            self.after_cancel(self._save_after_id)
+        self._save_after_id = self.after(200, self._flush_save)
+
+    def _flush_save(self):
+        self._save_after_id = None
+        if not self._save_pending:
+            return
+        self._save_pending = False
+        try:
+            save_config(CFG)
+        except Exception as e:
+            print(f"[Config] Save error: {e}")
+
+    def _schedule_rebuild(self):
+        """Rebuild the floating button once after a burst of setting changes."""
+        if self._rebuild_after_id is not None:
+            self.after_cancel(self._rebuild_after_id)
+        self._rebuild_after_id = self.after(150, self._do_rebuild)
+
+    def _do_rebuild(self):
+        self._rebuild_after_id = None
+        self.floating_btn.rebuild()
+
+    def _bind_setting(self, key, var, cast=None):
+        """Persist `var` to CFG[key] whenever it is written; returns the var."""
+        self._vars[key] = (var, cast)
+        var.trace_add("write", lambda *_: self._setting_var_changed(key))
+        return var
 
-    def _on_language_change(self, val):
-        self._save("language", val)
+    def _setting_var_changed(self, key):
+        var, cast = self._vars[key]
+        try:
+            value = var.get()
+            self._save(key, cast(value) if cast else value)
+        except (ValueError, tk.TclError):
+            pass
 
+    def _show_slider_value(self, key, label, text, force=False):
+        """Update a slider's value label at most ~30 times/sec, and only when the text changes."""
+        if text == self._slider_text.get(key):
+            return
+        now = time.monotonic()
+        if not force and now - self._slider_time.get(key, 0.0) < 1 / 30:
+            return
+        self._slider_text[key] = text
+        self._slider_time[key] = now
+        label.configure(text=text)
+
+    # Slider drags only update the label; the value is committed on release
     def _on_size_change(self, val):
-        v = int(val)
-        self.size_value_label.configure(text=f"{v}px")
+        self._show_slider_value("size", self.size_value_label, f"{int(val)}px")
+
+    def _on_size_release(self, event=None):
+        v = int(self.size_slider.get())
+        self._show_slider_value("size", self.size_value_label, f"{v}px", force=True)
+        if v == CFG.get("floating_btn_size", 60):
+            return  # Plain click on the thumb, nothing to save or rebuild
         self._save("floating_btn_size", v)
-        self.floating_btn.rebuild()
+        self._schedule_rebuild()
 
     def _on_opacity_change(self, val):
-        v = int(val)
-        self.opac_value_label.configure(text=f"{v}%")
+        self._show_slider_value("opacity", self.opac_value_label, f"{int(val)}%")
+
+    def _on_opacity_release(self, event=None):
+        v = int(self.opac_slider.get())
+        self._show_slider_value("opacity", self.opac_value_label, f"{v}%", force=True)
+        if v == round(CFG.get("floating_btn_opacity", 0.85) * 100):
+            return
         self._save("floating_btn_opacity", v / 100.0)
-        self.floating_btn.rebuild()
+        self._schedule_rebuild()
 
     def _on_float_toggle(self):
         enabled = self.show_float_var.get()
@@ -1088,7 +1669,7 @@ class VoiceAssistantApp(ctk.CTk):
 
     def _on_position_change(self, val):
         self._save("floating_btn_position", val)
-        self.floating_btn.rebuild()
+        self._schedule_rebuild()
 
     def _on_retention_change(self, val):
         label_to_days = {"Не удалять": 0, "1 день": 1, "3 дня": 3, "7 дней": 7, "30 дней": 30}
@@ -1117,15 +1698,30 @@ class VoiceAssistantApp(ctk.CTk):
         print("[Settings] AI settings saved.")
 
     def _cleanup_audio_file(self, file_path):
+        # Each take has its own temp file, so it is always removed once transcribed
+        self._io_exec.submit(self._remove_file, file_path)
         retention_days = int(CFG.get("recording_retention_days", 0))
-        if retention_days <= 0:
-            try:
-                os.remove(file_path)
-                log(f"Removed temp chunk: {file_path}")
-            except Exception as e:
-                log(f"Failed to remove temp chunk {file_path}: {e}")
-        else:
-            self._cleanup_old_recordings()
+        if retention_days > 0 and time.monotonic() - self._last_cleanup > CLEANUP_INTERVAL_S:
+            # Otherwise the periodic sweep will get to it
+            self._schedule_cleanup()
+
+    def _schedule_cleanup(self):
+        self._last_cleanup = time.monotonic()
+        self._io_exec.submit(self._cleanup_old_recordings)
+
+    def _periodic_cleanup(self):
+        """Run the retention sweep on a fixed cadence instead of after every recording."""
+        if int(CFG.get("recording_retention_days", 0)) > 0:
+            self._schedule_cleanup()
+        self.after(CLEANUP_INTERVAL_S * 1000, self._periodic_cleanup)
+
+    @staticmethod
+    def _remove_file(file_path):
+        try:
+            os.remove(file_path)
+            log(f"Removed temp chunk: {file_path}")
+        except Exception as e:
+            log(f"Failed to remove temp chunk {file_path}: {e}")
 
     def _cleanup_old_recordings(self):
         """Delete recordings older than configured retention period."""
@@ -1139,13 +1735,20 @@ class VoiceAssistantApp(ctk.CTk):
 
         cutoff = time.time() - (days * 86400)
         deleted = 0
-        for f in glob.glob(os.path.join(rec_path, "*.wav")):
-            try:
-                if os.path.getmtime(f) < cutoff:
-                    os.remove(f)
-                    deleted += 1
-            except Exception:
-                pass
+        # scandir yields entries with cached type info, so only one stat per file
+        try:
+            with os.scandir(rec_path) as it:
+                for entry in it:
+                    try:
+                        if not entry.name.lower().endswith(".wav") or not entry.is_file(follow_symlinks=False):
+                            continue
+                        if entry.stat(follow_symlinks=False).st_mtime < cutoff:
+                            os.remove(entry.path)
+                            deleted += 1
+                    except OSError:
+                        pass
+        except OSError as e:
+            print(f"[Cleanup] Error scanning {rec_path}: {e}")
         if deleted:
             print(f"[Cleanup] Deleted {deleted} old recording(s).")
 
@@ -1156,8 +1759,10 @@ class VoiceAssistantApp(ctk.CTk):
         self.hk_capture_btn.configure(state="disabled", text="Ожидание...")
 
         def listen():
+            if not _HAS_KEYBOARD:
+                self.after(0, lambda: self._finish_hotkey_capture(None, "keyboard не установлен"))
+                return
             try:
-                import keyboard
                 hk = keyboard.read_hotkey(suppress=False)
                 self.after(0, lambda: self._finish_hotkey_capture(hk))
             except Exception as e:
@@ -1177,8 +1782,11 @@ class VoiceAssistantApp(ctk.CTk):
 
     # ── Hotkey Registration ──
     def _register_hotkeys(self):
+        if not _HAS_KEYBOARD:
+            print("[Hotkey] keyboard module not available, global hotkey disabled.")
+            return
+        hk = CFG.get("hotkey", "ctrl+shift+space")
         try:
-            import keyboard
             # Remove only the previously registered hotkey, not all hooks
             if self._current_hotkey_id is not None:
                 try:
@@ -1187,11 +1795,11 @@ class VoiceAssistantApp(ctk.CTk):
                     pass
                 self._current_hotkey_id = None
 
-            hk = CFG.get("hotkey", "ctrl+shift+space")
-            # suppress=False prevents keyboard from freezing after toggle
-            # Use lambda + self.after to ensure thread-safe tkinter calls
+            # suppress=False prevents keyboard from freezing after toggle.
+            # The hook thread only posts a virtual event; Tk runs the handler.
             self._current_hotkey_id = keyboard.add_hotkey(
-                hk, lambda: self.after(0, self._toggle_recording), suppress=False
+                hk, lambda: self.event_generate("<<ToggleRecord>>", when="tail"),
+                suppress=False, trigger_on_release=False, timeout=0
             )
             print(f"[Hotkey] Registered: {hk}")
         except Exception as e:
@@ -1204,19 +1812,30 @@ class VoiceAssistantApp(ctk.CTk):
         else:
             self._start_recording()
 
+    def _on_recording_state_changed(self, started: bool):
+        """Apply all UI changes for a recording start/stop in one Tk callback."""
+        if started:
+            self.overlay.show()
+        else:
+            self.overlay.hide()
+        self.floating_btn.set_recording(started)
+
     def _start_recording(self):
         self._is_recording = True
         # Remember which window had focus so we can paste into it later
         try:
-            self._prev_hwnd = ctypes.windll.user32.GetForegroundWindow()
+            self._prev_hwnd = self._user32.GetForegroundWindow()
         except Exception:
             self._prev_hwnd = None
         try:
             mic_name = CFG.get("microphone", "По умолчанию")
             device_idx = AudioRecorder.get_device_index(mic_name)
-            self.recorder.start(device=device_idx)
-            self.after(0, self.overlay.show)
-            self.after(0, lambda: self.floating_btn.set_recording(True))
+            self.recorder.start(
+                device=device_idx,
+                blocksize=int(CFG.get("audio_blocksize", AudioRecorder.BLOCK_SIZE)),
+                latency=CFG.get("audio_latency", "low"),
+            )
+            self.after(0, self._on_recording_state_changed, True)
             log("[Recording] Started successfully.")
         except Exception as e:
             log(f"[Recording] Failed to start: {e}\n{traceback.format_exc()}")
@@ -1230,8 +1849,7 @@ class VoiceAssistantApp(ctk.CTk):
             log(f"[Recording] Error stopping: {e}\n{traceback.format_exc()}")
             audio_file = None
 
-        self.after(0, self.overlay.hide)
-        self.after(0, lambda: self.floating_btn.set_recording(False))
+        self.after(0, self._on_recording_state_changed, False)
         log(f"[Recording] Stopped. Audio file: {audio_file}")
 
         if audio_file:
@@ -1245,21 +1863,30 @@ class VoiceAssistantApp(ctk.CTk):
         try:
             if self.transcriber is None:
                 log("[AI] Loading model...")
-                from faster_whisper import WhisperModel
-                # Using 'tiny' model for fast CPU inference in standalone exe
-                self.transcriber = WhisperModel("tiny", device="auto", compute_type="int8")
+                self._ensure_model()
                 log("[AI] Model loaded successfully.")
 
             lang = CFG.get("language", "auto")
             whisper_lang = None if lang == "auto" else lang
 
             log(f"[_transcribe] Transcribing audio with language={whisper_lang}...")
+            # Decode in-process so faster-whisper does not spawn its own decoder for the file
+            audio, sr = sf.read(audio_file, dtype="float32", always_2d=False)
+            if audio.ndim > 1:
+                audio = audio.mean(axis=1)
+            if sr != 16000:
+                from scipy.signal import resample_poly
+                g = math.gcd(16000, sr)
+                audio = resample_poly(audio, 16000 // g, sr // g).astype(np.float32)
+
             segments, info = self.transcriber.transcribe(
-                audio_file, language=whisper_lang, beam_size=1,
+                audio, language=whisper_lang, beam_size=1,
                 vad_filter=True, vad_parameters=dict(min_silence_duration_ms=CFG.get("silence_threshold_ms", 500))
             )
 
-            text = " ".join(s.text for s in segments).strip()
+            # Strip per segment and drop empties so joins never produce double spaces
+            parts = [t for t in (seg.text.strip() for seg in segments if seg.text) if t]
+            text = " ".join(parts)
 
             if lang == "auto":
                 log(f"[Whisper] Detected: {info.language} ({info.language_probability:.0%})")
@@ -1271,38 +1898,43 @@ class VoiceAssistantApp(ctk.CTk):
                 return
 
             # Apply replacements
-            for rep in CFG.get("replacements", []):
-                match = rep.get("match", "")
-                replace = rep.get("replace", "")
-                if match:
-                    try:
-                        text = re.sub(match, replace, text, flags=re.IGNORECASE)
-                    except re.error:
-                        pass
+            for pat, repl in self._get_compiled_replacements():
+                try:
+                    text = pat.sub(repl, text)
+                except re.error:
+                    pass
 
             # ── GPT post-processing (if API key is set) ──
             ai_enabled = CFG.get("ai_enabled", True)
             api_key = CFG.get("ai_api_key", "").strip()
-            if text and api_key and ai_enabled:
+            # Very short utterances gain nothing from GPT but still cost a full round-trip
+            skip_gpt = len(text.split()) < 3 or len(text) < 12
+            if text and api_key and ai_enabled and skip_gpt:
+                print("[GPT] Skipping short text.")
+            elif text and api_key and ai_enabled:
                 try:
-                    # Reuse cached client for faster requests
-                    if self._openai_client is None:
-                        from openai import OpenAI
-                        self._openai_client = OpenAI(api_key=api_key)
+                    # Reuse cached client (and its keep-alive connections) for faster requests
+                    client = self._get_openai_client(api_key)
                     model = CFG.get("ai_model", "gpt-4o-mini")
                     prompt = CFG.get("ai_prompt", "Ты — корректор текста.")
 
                     print(f"[GPT] Sending to {model} for post-processing...")
-                    response = self._openai_client.chat.completions.create(
+                    stream = client.chat.completions.create(
                         model=model,
                         messages=[
                             {"role": "system", "content": prompt},
                             {"role": "user", "content": text}
                         ],
                         temperature=0.3,
-                        max_tokens=500,
+                        # Output is a corrected copy of the input, so size the budget from it
+                        max_tokens=min(500, len(text) * 2),
+                        stream=True,
                     )
-                    polished = response.choices[0].message.content.strip()
+                    parts = []
+                    for chunk in stream:
+                        if chunk.choices and chunk.choices[0].delta.content:
+                            parts.append(chunk.choices[0].delta.content)
+                    polished = "".join(parts).strip()
                     if polished:
                         print(f"[GPT Result] {polished}")
                         text = polished
@@ -1317,10 +1949,9 @@ class VoiceAssistantApp(ctk.CTk):
 
             log(f"[Final Result] {text}")
 
-            if text and CFG.get("auto_paste", True):
-                import pyperclip
-                import keyboard as kb
-
+            if text and CFG.get("auto_paste", True) and not _HAS_PYPERCLIP:
+                log("[Paste] pyperclip not available, skipping paste.")
+            elif text and CFG.get("auto_paste", True):
                 log("[Paste] Copying to clipboard...")
                 old_clip = pyperclip.paste()
                 pyperclip.copy(text)
@@ -1329,8 +1960,8 @@ class VoiceAssistantApp(ctk.CTk):
                 try:
                     hwnd = getattr(self, '_prev_hwnd', None)
                     if hwnd:
-                        user32 = ctypes.windll.user32
-                        kernel32 = ctypes.windll.kernel32
+                        user32 = self._user32
+                        kernel32 = self._kernel32
                         our_tid = kernel32.GetCurrentThreadId()
                         target_tid = user32.GetWindowThreadProcessId(hwnd, None)
                         if our_tid != target_tid:
@@ -1343,9 +1974,8 @@ class VoiceAssistantApp(ctk.CTk):
                     log(f"[Paste] Focus restore error: {e}")
 
                 log("[Paste] Sending Ctrl+V...")
-                time.sleep(0.02)
-                kb.press_and_release('ctrl+v')
-                time.sleep(0.02)
+                if not self._send_ctrl_v() and _HAS_KEYBOARD:
+                    keyboard.press_and_release('ctrl+v')
                 # Option to restore clipboard omitted for now to not break pasting
                 # pyperclip.copy(old_clip)
 
@@ -1359,24 +1989,106 @@ class VoiceAssistantApp(ctk.CTk):
 
 
 
+    def _get_openai_client(self, api_key):
+        """Return the cached OpenAI client, rebuilding it if the API key has changed."""
+        with self._openai_lock:
+            if self._openai_client is None or self._openai_key != api_key:
+                if self._openai_client is not None:
+                    try:
+                        self._openai_client.close()
+                    except Exception:
+                        pass
+                self._openai_client = self._create_openai_client(api_key)
+                self._openai_key = api_key
+            return self._openai_client
+
+    @staticmethod
+    def _create_openai_client(api_key):
+        import httpx
+        from openai import OpenAI
+        limits = httpx.Limits(max_keepalive_connections=4, keepalive_expiry=60)
+        try:
+            http_client = httpx.Client(http2=True, timeout=30.0, limits=limits)
+        except ImportError:
+            # http2 needs the optional 'h2' package; keep-alive still works on HTTP/1.1
+            http_client = httpx.Client(timeout=30.0, limits=limits)
+        return OpenAI(api_key=api_key, http_client=http_client)
+
+    def _prewarm_openai(self):
+        """Build the OpenAI client in the background if AI post-processing is configured."""
+        api_key = CFG.get("ai_api_key", "").strip()
+        if not _HAS_OPENAI or not api_key or not CFG.get("ai_enabled", True):
+            return
+        try:
+            self._get_openai_client(api_key)
+            print("[GPT] Client pre-warmed.")
+        except Exception as e:
+            print(f"[GPT] Pre-warm error: {e}")
+
     # ── Lazy Model Loading ──
     def _lazy_load_model(self):
         if self._model_loading:
             return
+        if not _HAS_FASTER_WHISPER:
+            print("[AI] faster-whisper is not installed, transcription unavailable.")
+            return
         self._model_loading = True
         print("[AI] Loading model in background...")
 
         def load():
             try:
-                from faster_whisper import WhisperModel
-                self.transcriber = WhisperModel("tiny", device="auto", compute_type="int8")
+                self._ensure_model()
                 print("[AI] Model loaded successfully.")
             except Exception as e:
                 print(f"[AI] Model loading error: {e}")
 
         threading.Thread(target=load, daemon=True).start()
 
+    def _ensure_model(self):
+        """Return the shared WhisperModel, creating it once under _model_lock."""
+        with self._model_lock:
+            if self.transcriber is None:
+                self.transcriber = self._create_whisper_model()
+            return self.transcriber
+
+    @staticmethod
+    def _create_whisper_model():
+        from faster_whisper import WhisperModel
+        try:
+            import ctranslate2
+            has_cuda = ctranslate2.get_cuda_device_count() > 0
+        except Exception:
+            has_cuda = False
+
+        # Using 'tiny' model for fast inference in standalone exe
+        if has_cuda:
+            try:
+                model = WhisperModel("tiny", device="cuda", compute_type="int8_float16", num_workers=1)
+                print("[AI] Using CUDA (int8_float16).")
+                return model
+            except Exception as e:
+                print(f"[AI] CUDA init failed, falling back to CPU: {e}")
+        return WhisperModel("tiny", device="cpu", compute_type="int8",
+                            cpu_threads=max(1, (os.cpu_count() or 2) // 2))
+
     # ── Replacements Helpers ──
+    def _get_compiled_replacements(self):
+        """Return [(pattern, replacement)] compiled once from CFG["replacements"]."""
+        reps = self._compiled_reps
+        if reps is None:
+            reps = []
+            for rep in CFG.get("replacements", []):
+                match = rep.get("match", "")
+                if not match:
+                    continue
+                flags = re.IGNORECASE if rep.get("ignore_case", True) else 0
+                try:
+                    reps.append((re.compile(match, flags), rep.get("replace", "")))
+                except re.error as e:
+                    log(f"[Replacements] Skipping invalid pattern {match!r}: {e}")
+            self._compiled_reps = reps
+        return reps
+
     def _add_replacement(self):
         find = self.rep_find_var.get().strip()
         replace = self.rep_replace_var.get().strip()
@@ -1385,6 +2097,7 @@ class VoiceAssistantApp(ctk.CTk):
         reps = CFG.get("replacements", [])
         reps.append({"match": find, "replace": replace, "ignore_case": True})
         self._save("replacements", reps)
+        self._compiled_reps = None
         self.rep_find_var.set("")
         self.rep_replace_var.set("")
         self._refresh_replacements_list()
@@ -1394,26 +2107,48 @@ class VoiceAssistantApp(ctk.CTk):
         if 0 <= index < len(reps):
             reps.pop(index)
             self._save("replacements", reps)
+            self._compiled_reps = None
             self._refresh_replacements_list()
 
     def _refresh_replacements_list(self):
-        for w in self.rep_list_frame.winfo_children():
-            w.destroy()
-
+        """Sync the row pool with CFG["replacements"], creating/destroying only the delta."""
         reps = CFG.get("replacements", [])
+
         if not reps:
-            ctk.CTkLabel(self.rep_list_frame, text="Нет замен. Добавьте выше.",
-                         text_color="gray50").pack(padx=15, pady=10)
+            for row in self._rep_rows:
+                row["frame"].destroy()
+            self._rep_rows = []
+            if self._rep_empty_label is None:
+                self._rep_empty_label = ctk.CTkLabel(self.rep_list_frame, text="Нет замен. Добавьте выше.",
+                                                     text_color="gray50")
+            self._rep_empty_label.pack(padx=15, pady=10)
             return
 
+        if self._rep_empty_label is not None:
+            self._rep_empty_label.pack_forget()
+
         for i, rep in enumerate(reps):
-            row = ctk.CTkFrame(self.rep_list_frame, fg_color="transparent")
-            row.pack(fill="x", padx=10, pady=3)
-            ctk.CTkLabel(row, text=f'"{rep["match"]}" → "{rep["replace"]}"',
-                         font=ctk.CTkFont(size=12)).pack(side="left", padx=10)
-            ctk.CTkButton(row, text="🗑", width=30, fg_color="transparent",
-                          hover_color=("#ff4444", "#cc0000"),
-                          command=lambda idx=i: self._remove_replacement(idx)).pack(side="right", padx=5)
+            text = f'"{rep["match"]}" → "{rep["replace"]}"'
+            command = lambda idx=i: self._remove_replacement(idx)
+            if i < len(self._rep_rows):
+                row = self._rep_rows[i]
+                row["label"].configure(text=text)
+                row["button"].configure(command=command)
+                continue
+            frame = ctk.CTkFrame(self.rep_list_frame, fg_color="transparent")
+            frame.pack(fill="x", padx=10, pady=3)
+            label = ctk.CTkLabel(frame, text=text, font=self._font(12))
+            label.pack(side="left", padx=10)
+            button = ctk.CTkButton(frame, text="🗑", width=30, fg_color="transparent",
+                                   hover_color=("#ff4444", "#cc0000"), command=command)
+            button.pack(side="right", padx=5)
+            self._rep_rows.append({"frame": frame, "label": label, "button": button})
+
+        for row in self._rep_rows[len(reps):]:
+            row["frame"].destroy()
+        del self._rep_rows[len(reps):]
+
+        self.rep_list_frame.update_idletasks()
 
 
 # ═══════════════════════════════════════════════════════════════